@@ -18,6 +18,7 @@ setup_args = dict(
         'flask',
         'flask-caching',
         'flask-redis',
+        'orjson',
         'requests',
     ]
 )
@@ -1,18 +1,178 @@
 """Uses hypothesis to generate mock data for YARN, Spark, and MapReduce
 REST resources and serves them using Flask for testing purposes.
+
+Example payloads are generated once at import time into fixed pools that
+the request handlers sample from: hypothesis' example() is deliberately
+slow, and keeping it out of the request path stops the mock itself from
+throttling whatever is polling it.
 """
 import os
+import random
 import string
 import time
 
-from flask import Flask, request, json, make_response
+from flask import Flask, request, make_response
 from flask_redis import FlaskRedis
 import hypothesis.strategies as st
 
+try:
+    import orjson
+except ImportError:
+    # The stdlib codec exposes the same dumps subset used here, just slower
+    import json as orjson
+
 app = Flask(__name__)
 app.config["REDIS_URL"] = "redis://" + os.getenv("REDIS_ENDPOINT", "localhost:6379")
 redis = FlaskRedis(app)
 
+# Number of pregenerated examples each handler rotates through
+POOL_SIZE = 64
+
+# Integer fields are capped at 2**53 - 1: unbounded strategies draw values
+# beyond the 64-bit range orjson can serialize, and real YARN never emits
+# anything close to that large anyway
+application_strategy = st.fixed_dictionaries({
+    'allocatedMB': st.integers(-1, 2**53 - 1),
+    'allocatedVCores': st.integers(-1, 2**53 - 1),
+    'amContainerLogs': st.text(),
+    'amHostHttpAddress': st.text(),
+    'applicationTags': st.text(),
+    'applicationType': st.sampled_from(['MAPREDUCE', 'SPARK']),
+    'clusterId': st.integers(0, 2**53 - 1),
+    'diagnostics': st.text(),
+    'elapsedTime': st.integers(0, 2**53 - 1),
+    'finalStatus': st.sampled_from(['UNDEFINED', 'SUCCEEDED', 'FAILED', 'KILLED']),
+    'finishedTime': st.integers(0, 2**53 - 1),
+    'id': st.text(string.ascii_letters, min_size=5, max_size=25),
+    'memorySeconds': st.integers(0, 2**53 - 1),
+    'name': st.text(min_size=5),
+    'numAMContainerPreempted': st.integers(0, 2**53 - 1),
+    'numNonAMContainerPreempted': st.integers(0, 2**53 - 1),
+    'preemptedResourceMB': st.integers(0, 2**53 - 1),
+    'preemptedResourceVCores': st.integers(0, 2**53 - 1),
+    'progress': st.floats(0, 100),
+    'queue': st.text(),
+    'runningContainers': st.integers(-1, 2**53 - 1),
+    'startedTime': st.integers(0, 2**53 - 1),
+    'state': st.sampled_from(['NEW', 'NEW_SAVING', 'SUBMITTED', 'ACCEPTED', 'RUNNING', 'FINISHED', 'FAILED', 'KILLED']),
+    'trackingUI': st.text(),
+    'trackingUrl': st.just(os.environ['YARN_ENDPOINT']),
+    'user': st.text(),
+    'vcoreSeconds': st.integers(0, 2**53 - 1)
+})
+
+cluster_metrics_strategy = st.fixed_dictionaries({
+    'activeNodes': st.integers(0, 2**53 - 1),
+    'allocatedMB': st.integers(0, 2**53 - 1),
+    'allocatedVirtualCores': st.integers(0, 2**53 - 1),
+    'appsCompleted': st.integers(0, 2**53 - 1),
+    'appsFailed': st.integers(0, 2**53 - 1),
+    'appsKilled': st.integers(0, 2**53 - 1),
+    'appsPending': st.integers(0, 2**53 - 1),
+    'appsRunning': st.integers(0, 2**53 - 1),
+    'appsSubmitted': st.integers(0, 2**53 - 1),
+    'availableMB': st.integers(0, 2**53 - 1),
+    'availableVirtualCores': st.integers(0, 2**53 - 1),
+    'containersAllocated': st.integers(0, 2**53 - 1),
+    'containersPending': st.integers(0, 2**53 - 1),
+    'containersReserved': st.integers(0, 2**53 - 1),
+    'decommissionedNodes': st.integers(0, 2**53 - 1),
+    'lostNodes': st.integers(0, 2**53 - 1),
+    'rebootedNodes': st.integers(0, 2**53 - 1),
+    'reservedMB': st.integers(0, 2**53 - 1),
+    'reservedVirtualCores': st.integers(0, 2**53 - 1),
+    'totalMB': st.integers(0, 2**53 - 1),
+    'totalNodes': st.integers(0, 2**53 - 1),
+    'totalVirtualCores': st.integers(0, 2**53 - 1),
+    'unhealthyNodes': st.integers(0, 2**53 - 1)
+})
+
+spark_job_strategy = st.fixed_dictionaries({
+    'jobId': st.integers(0, 2**53 - 1),
+    'name': st.text(),
+    'submissionTime': st.text(),
+    'completionTime': st.text(),
+    'stageIds': st.lists(st.integers(0, 2**53 - 1), max_size=5),
+    'status': st.sampled_from(['SUCCEEDED', 'RUNNING', 'FAILED']),
+    'numTasks': st.integers(0, 2**53 - 1),
+    'numActiveTasks': st.integers(0, 2**53 - 1),
+    'numCompletedTasks': st.integers(0, 2**53 - 1),
+    'numSkippedTasks': st.integers(0, 2**53 - 1),
+    'numFailedTasks': st.integers(0, 2**53 - 1),
+    'numActiveStages': st.integers(0, 2**53 - 1),
+    'numCompletedStages': st.integers(0, 2**53 - 1),
+    'numSkippedStages': st.integers(0, 2**53 - 1),
+    'numFailedStages': st.integers(0, 2**53 - 1),
+})
+
+mapreduce_job_strategy = st.fixed_dictionaries({
+    'startTime': st.integers(0, 2**53 - 1),
+    'finishTime': st.integers(0, 2**53 - 1),
+    'elapsedTime': st.integers(0, 2**53 - 1),
+    'id': st.integers(0, 2**53 - 1),
+    'name': st.text(),
+    'user': st.text(),
+    'state': st.sampled_from(['NEW', 'SUCCEEDED', 'RUNNING', 'FAILED', 'KILLED']),
+    'mapsTotal': st.integers(0, 2**53 - 1),
+    'mapsCompleted': st.integers(0, 2**53 - 1),
+    'reducesTotal': st.integers(0, 2**53 - 1),
+    'reducesCompleted': st.integers(0, 2**53 - 1),
+    'mapProgress': st.floats(0, 100),
+    'reduceProgress': st.floats(0, 100),
+    'mapsPending': st.integers(0, 2**53 - 1),
+    'mapsRunning': st.integers(0, 2**53 - 1),
+    'reducesPending': st.integers(0, 2**53 - 1),
+    'reducesRunning': st.integers(0, 2**53 - 1),
+    'uberized': st.booleans(),
+    'diagnostics': st.text(),
+    'newReduceAttempts': st.integers(0, 2**53 - 1),
+    'runningReduceAttempts': st.integers(0, 2**53 - 1),
+    'failedReduceAttempts': st.integers(0, 2**53 - 1),
+    'killedReduceAttempts': st.integers(0, 2**53 - 1),
+    'successfulReduceAttempts': st.integers(0, 2**53 - 1),
+    'newMapAttempts': st.integers(0, 2**53 - 1),
+    'runningMapAttempts': st.integers(0, 2**53 - 1),
+    'failedMapAttempts': st.integers(0, 2**53 - 1),
+    'killedMapAttempts': st.integers(0, 2**53 - 1),
+    'successfulMapAttempts': st.integers(0, 2**53 - 1)
+})
+
+
+def example_pool(strategy, size=POOL_SIZE):
+    """Generates a fixed pool of example values from a strategy.
+
+    Parameters
+    ----------
+    strategy: hypothesis.strategies.SearchStrategy
+        Strategy to draw examples from
+    size: int, optional
+        Number of examples to pregenerate
+
+    Returns
+    -------
+    list
+    """
+    return [strategy.example() for _ in range(size)]
+
+
+application_pool = example_pool(st.lists(application_strategy, min_size=4, max_size=10))
+cluster_metrics_pool = example_pool(cluster_metrics_strategy)
+spark_jobs_pool = example_pool(st.lists(spark_job_strategy, max_size=5))
+mapreduce_jobs_pool = example_pool(st.lists(mapreduce_job_strategy, max_size=5))
+
+
+def dumps_bytes(obj):
+    """Serializes an object to JSON bytes regardless of which codec is in
+    use, so identical bytes are stored in redis and served in responses
+    with no UTF-8 round-trips on the cache-hit path.
+
+    Returns
+    -------
+    bytes
+    """
+    encoded = orjson.dumps(obj)
+    return encoded if isinstance(encoded, bytes) else encoded.encode('utf-8')
+
 
 def jsonify(text):
     """Substitute for flask.jsonify which accepts an already encoded
@@ -28,39 +188,9 @@ def applications():
     if 'last' in request.args:
         return jsonify(redis.get(request.base_url))
 
-    d = st.fixed_dictionaries({
-        'allocatedMB': st.integers(-1),
-        'allocatedVCores': st.integers(-1),
-        'amContainerLogs': st.text(),
-        'amHostHttpAddress': st.text(),
-        'applicationTags': st.text(),
-        'applicationType': st.sampled_from(['MAPREDUCE', 'SPARK']),
-        'clusterId': st.integers(0),
-        'diagnostics': st.text(),
-        'elapsedTime': st.integers(0),
-        'finalStatus': st.sampled_from(['UNDEFINED', 'SUCCEEDED', 'FAILED', 'KILLED']),
-        'finishedTime': st.integers(0),
-        'id': st.text(string.ascii_letters, min_size=5, max_size=25),
-        'memorySeconds': st.integers(0),
-        'name': st.text(min_size=5),
-        'numAMContainerPreempted': st.integers(0),
-        'numNonAMContainerPreempted': st.integers(0),
-        'preemptedResourceMB': st.integers(0),
-        'preemptedResourceVCores': st.integers(0),
-        'progress': st.floats(0, 100),
-        'queue': st.text(),
-        'runningContainers': st.integers(-1),
-        'startedTime': st.integers(0),
-        'state': st.sampled_from(['NEW', 'NEW_SAVING', 'SUBMITTED', 'ACCEPTED', 'RUNNING', 'FINISHED', 'FAILED', 'KILLED']),
-        'trackingUI': st.text(),
-        'trackingUrl': st.just(os.environ['YARN_ENDPOINT']),
-        'user': st.text(),
-        'vcoreSeconds': st.integers(0)
-    })
-
-    result = json.dumps({
+    result = dumps_bytes({
         'apps': {
-            'app': st.lists(d, min_size=4, max_size=10).example()
+            'app': random.choice(application_pool)
         }
     })
     redis.set(request.base_url, result)
@@ -73,33 +203,8 @@ def metrics():
     if 'last' in request.args:
         return jsonify(redis.get(request.base_url))
 
-    d = st.fixed_dictionaries({
-        'activeNodes': st.integers(0),
-        'allocatedMB': st.integers(0),
-        'allocatedVirtualCores': st.integers(0),
-        'appsCompleted': st.integers(0),
-        'appsFailed': st.integers(0),
-        'appsKilled': st.integers(0),
-        'appsPending': st.integers(0),
-        'appsRunning': st.integers(0),
-        'appsSubmitted': st.integers(0),
-        'availableMB': st.integers(0),
-        'availableVirtualCores': st.integers(0),
-        'containersAllocated': st.integers(0),
-        'containersPending': st.integers(0),
-        'containersReserved': st.integers(0),
-        'decommissionedNodes': st.integers(0),
-        'lostNodes': st.integers(0),
-        'rebootedNodes': st.integers(0),
-        'reservedMB': st.integers(0),
-        'reservedVirtualCores': st.integers(0),
-        'totalMB': st.integers(0),
-        'totalNodes': st.integers(0),
-        'totalVirtualCores': st.integers(0),
-        'unhealthyNodes': st.integers(0)
-    })
-    result = json.dumps({
-        'clusterMetrics': d.example()
+    result = dumps_bytes({
+        'clusterMetrics': random.choice(cluster_metrics_pool)
     })
     redis.set(request.base_url, result)
     return jsonify(result)
@@ -111,24 +216,7 @@ def spark_application(app_id):
     if 'last' in request.args:
         return jsonify(redis.get(request.base_url))
 
-    d = st.fixed_dictionaries({
-        'jobId': st.integers(0),
-        'name': st.text(),
-        'submissionTime': st.text(),
-        'completionTime': st.text(),
-        'stageIds': st.lists(st.integers(0), max_size=5),
-        'status': st.sampled_from(['SUCCEEDED', 'RUNNING', 'FAILED']),
-        'numTasks': st.integers(0),
-        'numActiveTasks': st.integers(0),
-        'numCompletedTasks': st.integers(0),
-        'numSkippedTasks': st.integers(0),
-        'numFailedTasks': st.integers(0),
-        'numActiveStages': st.integers(0),
-        'numCompletedStages': st.integers(0),
-        'numSkippedStages': st.integers(0),
-        'numFailedStages': st.integers(0),
-    })
-    result = json.dumps(st.lists(d, max_size=5).example())
+    result = dumps_bytes(random.choice(spark_jobs_pool))
     redis.set(request.base_url, result)
     return jsonify(result)
 
@@ -139,40 +227,9 @@ def mapreduce_application():
     if 'last' in request.args:
         return jsonify(redis.get(request.base_url))
 
-    d = st.fixed_dictionaries({
-        'startTime': st.integers(0),
-        'finishTime': st.integers(0),
-        'elapsedTime': st.integers(0),
-        'id': st.integers(0),
-        'name': st.text(),
-        'user': st.text(),
-        'state': st.sampled_from(['NEW', 'SUCCEEDED', 'RUNNING', 'FAILED', 'KILLED']),
-        'mapsTotal': st.integers(0),
-        'mapsCompleted': st.integers(0),
-        'reducesTotal': st.integers(0),
-        'reducesCompleted': st.integers(0),
-        'mapProgress': st.floats(0, 100),
-        'reduceProgress': st.floats(0, 100),
-        'mapsPending': st.integers(0),
-        'mapsRunning': st.integers(0),
-        'reducesPending': st.integers(0),
-        'reducesRunning': st.integers(0),
-        'uberized': st.booleans(),
-        'diagnostics': st.text(),
-        'newReduceAttempts': st.integers(0),
-        'runningReduceAttempts': st.integers(0),
-        'failedReduceAttempts': st.integers(0),
-        'killedReduceAttempts': st.integers(0),
-        'successfulReduceAttempts': st.integers(0),
-        'newMapAttempts': st.integers(0),
-        'runningMapAttempts': st.integers(0),
-        'failedMapAttempts': st.integers(0),
-        'killedMapAttempts': st.integers(0),
-        'successfulMapAttempts': st.integers(0)
-    })
-    result = json.dumps({
+    result = dumps_bytes({
         'jobs': {
-            'job': st.lists(d, max_size=5).example()
+            'job': random.choice(mapreduce_jobs_pool)
         }
     })
     redis.set(request.base_url, result)
@@ -1,5 +1,5 @@
 """YARN monitoring RESTful API."""
-from flask import jsonify, Blueprint
+from flask import jsonify, Blueprint, Response
 
 
 api_bp = Blueprint('api', __name__)
@@ -16,6 +16,27 @@ def get_model(cluster):
     return get_model(cluster)
 
 
+def _prerendered_json(key):
+    """Gets a response streaming JSON bytes prerendered in redis by the
+    background worker, bypassing per-request serialization.
+
+    Parameters
+    ----------
+    key: str
+        Redis key holding the prerendered JSON payload
+
+    Returns
+    -------
+    flask.Response or None
+        None when the worker has not populated the key
+    """
+    from .core import redis_store
+    body = redis_store.get(key)
+    if body is None:
+        return None
+    return Response(body, mimetype='application/json')
+
+
 @api_bp.route('/api/clusters/<cluster>')
 def get_cluster(cluster):
     """Gets cluster-level metrics.
@@ -30,6 +51,11 @@ def get_cluster(cluster):
     -------
     JSON str
     """
+    resp = _prerendered_json(cluster + ':cluster')
+    if resp is not None:
+        return resp
+    # Fall back to the state blob when the worker has not prerendered
+    # this payload, e.g. while an older worker version is still running
     ym = get_model(cluster)
     return jsonify({"data": [ym.cluster_metrics()]})
 
@@ -70,6 +96,11 @@ def get_applications(cluster):
     -------
     JSON str
     """
+    resp = _prerendered_json(cluster + ':applications')
+    if resp is not None:
+        return resp
+    # Fall back to the state blob when the worker has not prerendered
+    # this payload, e.g. while an older worker version is still running
     ym = get_model(cluster)
     data = [value for value in ym.applications().values()]
     return jsonify({'data': data})
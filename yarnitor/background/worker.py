@@ -13,6 +13,15 @@ REDIS_ENDPOINT
     host:port for a redis instance
 REDIS_KEY
     Redis key / cluster name under which to store app info (default: "default")
+YARN_THREADPOOL_SIZE
+    number of threads used to fetch application details in parallel
+    (default: 5 per CPU, at least 8 and at most 32)
+YARN_THREADPOOL_TIMEOUT
+    seconds to wait for all application detail fetches in a polling cycle
+    before marking stragglers non-responsive (default: 120)
+YARN_APPS_DESELECTS
+    optional deSelects query value sent to the RM apps endpoint (YARN 2.8+)
+    to shrink response payloads, e.g. "resourceRequests"
 LOG_LEVEL
     DEBUG, INFO (default), WARNING, ERROR strings from the logging package
 """
@@ -20,22 +29,52 @@ LOG_LEVEL
 import atexit
 import concurrent.futures
 import datetime
-import json
+import hashlib
+import itertools
 import logging
 import os
+import queue
+import threading
 import time
 
+from operator import itemgetter
 from urllib.parse import urlparse
 
 import redis
 import requests
 
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # The stdlib codec exposes the same dumps/loads subset used here, it is
+    # just slower. Keeps the worker importable where orjson is unavailable.
+    import json as orjson
+
 logger = logging.getLogger("yarn-background-worker")
 
-# Number of workers in the threadpool
-THREADPOOL_SIZE = 16
+
+def dumps_bytes(obj):
+    """Serializes an object to JSON bytes regardless of which codec is in
+    use, so the payload can be hashed and written to redis the same way
+    under the stdlib fallback as under orjson.
+
+    Returns
+    -------
+    bytes
+    """
+    encoded = orjson.dumps(obj)
+    return encoded if isinstance(encoded, bytes) else encoded.encode('utf-8')
+
+# Number of workers in the threadpool; the tasks are I/O-bound so the
+# default oversubscribes the CPUs, within sane bounds for small and large
+# boxes alike
+THREADPOOL_SIZE = int(os.getenv('YARN_THREADPOOL_SIZE',
+                                min(32, max(8, (os.cpu_count() or 1) * 5))))
 # Timeout for fetching results using the threadpool
-THREADPOOL_TIMEOUT = 120
+THREADPOOL_TIMEOUT = int(os.getenv('YARN_THREADPOOL_TIMEOUT', 120))
 # Sentinel state used when we fail to query the application for its state
 NON_RESPONSIVE_STATE = 'NON_RESPONSIVE'
 # The YARN API responds with a Redirect header when the configured
@@ -48,25 +87,53 @@ NON_RESPONSIVE_STATE = 'NON_RESPONSIVE'
 # try again. This cap avoids the potential for endless, busy loop
 # ping-ponging among YARN ResourceManagers.
 MAX_HA_REDIRECTS = 5
-
-# Global threadpool for running async tasks
-threadpool = concurrent.futures.ThreadPoolExecutor(THREADPOOL_SIZE)
-# Shut down the pool when the process is exiting, passing False to
-# avoid waiting in this lambda for all tasks to complete.
-atexit.register(lambda: threadpool.shutdown(False))
-
-class Progress(object):
-    """Utility class for storing mutable progress information."""
-    def __init__(self, name, completed=0, failed=0, running=0, total=0):
-        self.name = name
-        self.completed = completed
-        self.failed = failed
-        self.running = running
-        self.total = total
-
-    def to_dict(self):
-        return self.__dict__
-
+# Optional value for the RM apps endpoint's deSelects query parameter
+# (YARN 2.8+), e.g. "resourceRequests", trimming response fields yarnitor
+# never reads. Left empty by default for compatibility with older RMs.
+YARN_APPS_DESELECTS = os.getenv('YARN_APPS_DESELECTS', '')
+# Fields copied verbatim from the YARN application info into the
+# standardized structure sent to the frontend
+VERBATIM_FIELDS = ("id", "name", "user", "applicationType", "queue",
+                   "startedTime", "allocatedMB", "allocatedVCores",
+                   "trackingUrl", "state", "memorySeconds", "vcoreSeconds")
+# Bound once so the per-app field extraction runs as a single C call
+_get_verbatim_fields = itemgetter(*VERBATIM_FIELDS)
+
+# Global threadpool for running async tasks, created lazily by get_threadpool
+_threadpool = None
+
+
+def get_threadpool():
+    """Gets the global threadpool, creating it on first use.
+
+    Returns
+    -------
+    concurrent.futures.ThreadPoolExecutor
+    """
+    global _threadpool
+    if _threadpool is None:
+        _threadpool = concurrent.futures.ThreadPoolExecutor(THREADPOOL_SIZE)
+        # Shut down the pool when the process is exiting, passing False to
+        # avoid waiting in this lambda for all tasks to complete.
+        atexit.register(lambda: _threadpool.shutdown(False))
+    return _threadpool
+
+# Shared HTTP session so sockets to the RM and tracking URL hosts are kept
+# alive and reused across threadpool tasks and poll cycles rather than
+# re-established for every request
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                       max_retries=Retry(total=2, backoff_factor=0.1))
+SESSION.mount('http://', _adapter)
+SESSION.mount('https://', _adapter)
+
+# Cached (etag, last-modified, parsed response) entries keyed by tracking URL
+# + query params, used to issue conditional GETs so unchanged responses cost
+# neither bandwidth nor a JSON parse
+_etag_cache = {}
+# Upper bound on cached tracking responses; the cache is simply cleared when
+# it fills since entries are cheap to repopulate on the next poll
+_ETAG_CACHE_MAX = 1024
 
 class YARNHandler(object):
     """Manages HTTP communication with a YARN ResourceManager (RM) to fetch
@@ -80,18 +147,30 @@ class YARNHandler(object):
         primary RM and the others are used if the primary becomes unavailable.
     version: str, optional
         Version of the YARN RM API
+    cache_ttl: float, optional
+        Seconds for which RM responses are reused instead of re-fetched,
+        0 disables caching
 
     Attributes
     ----------
     base_url: dict
         'host' and 'version' of the YARN RM
     """
-    def __init__(self, host, version="v1"):
+    def __init__(self, host, version="v1", cache_ttl=0):
         self.all_hosts = host.split(',')
         self.base_url = {
             'host': self.all_hosts[0],
             'version': version
         }
+        self.cache_ttl = cache_ttl
+        # Round-robin over the configured hosts for failover so repeated
+        # failures walk through every RM instead of retrying the same one
+        self._host_cycle = itertools.cycle(self.all_hosts)
+        # Maps (path, params) to (response, expiry) pairs
+        self._cache = {}
+        # Kept as an attribute so tests or callers can substitute their own
+        # session; defaults to the shared pooled keep-alive session
+        self.session = SESSION
 
     def current_rm(self):
         """Gets the URL of the YARN RM last queried, successfully or not.
@@ -124,15 +203,16 @@ class YARNHandler(object):
         for i in range(MAX_HA_REDIRECTS):
             final_url = "{host}/ws/{version}/{path}".format(path=path, **self.base_url)
             try:
-                resp = requests.get(final_url, params)
+                resp = self.session.get(final_url, params=params)
                 resp.raise_for_status()
             except requests.exceptions.RequestException as ex:
                 # Take the host out of the pool of available for this attempt only
                 available_hosts.remove(self.base_url['host'])
                 if not available_hosts:
                     raise RuntimeError('No active YARN RM hosts left to try')
-                # Take one, any one, as the new primary
-                for new_host in available_hosts: break
+                # Advance the round-robin to the next host still in the pool
+                new_host = next(host for host in self._host_cycle
+                                if host in available_hosts)
                 self.base_url['host'] = new_host
                 logger.warn('Unable to GET %s, switching to YARN RM at %s', final_url, new_host)
             else:
@@ -151,9 +231,40 @@ class YARNHandler(object):
                 logger.warn('Redirected from %s, switching to YARN RM at: %s', final_url, new_host)
         else:
             raise RuntimeError('Too many YARN redirects')
-        return resp.json()
+        # Parse the raw bytes directly to skip requests' decode-then-parse step
+        return orjson.loads(resp.content)
+
+    def _cached_get_url(self, path, **params):
+        """Issues a GET through `get_url`, reusing a previous response for
+        the same path and parameters while it is younger than `cache_ttl`.
+
+        Keeps polling faster than YARN's own metric refresh cadence from
+        hammering the RM with queries for identical results.
 
-    def cluster_applications(self, *state):
+        Parameters
+        ----------
+        path: str
+            Path to append to the root YARN RM path
+        **params, dict
+            Query parameters to append to the YARN RM URL
+
+        Returns
+        -------
+        dict
+            JSON decoded response
+        """
+        if not self.cache_ttl:
+            return self.get_url(path, **params)
+        key = (path, tuple(sorted(params.items())))
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[1] > now:
+            return hit[0]
+        value = self.get_url(path, **params)
+        self._cache[key] = (value, now + self.cache_ttl)
+        return value
+
+    def cluster_applications(self, *state, **params):
         """Gets information about YARN apps with the given state.
 
         Parameters
@@ -161,13 +272,16 @@ class YARNHandler(object):
         *state: str, optional
             Request applications with the given string state(s) only.
             Empty means apps with any state will be included in the response.
+        **params: dict, optional
+            Additional query parameters forwarded verbatim to the RM, e.g.
+            deSelects (YARN 2.8+) to trim unused fields from the response
 
         Returns
         -------
         dict
             JSON decoded response from the YARN RM
         """
-        return self.get_url("cluster/apps", state=','.join(state))
+        return self._cached_get_url("cluster/apps", state=','.join(state), **params)
 
     def cluster_metrics(self):
         """Gest information about the YARN cluster.
@@ -177,7 +291,7 @@ class YARNHandler(object):
         dict
             JSON decoded response from the YARN RM
         """
-        return self.get_url("cluster/metrics")
+        return self._cached_get_url("cluster/metrics")
 
 
 class BaseHandler(object):
@@ -190,10 +304,22 @@ class BaseHandler(object):
         URL of the server responsible for tracking the status of the YARN app
     application_id: str
         Unique ID of the YARN application
+    session: requests.Session, optional
+        HTTP session to issue requests with; defaults to the shared pooled
+        keep-alive session so sockets are reused across all handlers
     """
-    def __init__(self, tracking_url, application_id):
+    # Slots keep the many short-lived per-app handler instances off the
+    # per-instance __dict__ allocation path
+    __slots__ = ("tracking_url", "application_id", "session", "_cookies")
+
+    def __init__(self, tracking_url, application_id, session=None):
         self.tracking_url = tracking_url.rstrip("/")
         self.application_id = application_id
+        self.session = session if session is not None else SESSION
+        # Under some security models, the YARN proxy requires that a user click a link in
+        # order to access the tracking URL. Setting a cookie has the same effect,
+        # programmatically. Built once here; requests copies it per call.
+        self._cookies = {"checked_{}".format(application_id): 'true'}
 
     def get_url(self, path, **params):
         """Issues an HTTP GET against the given path on the app tracking server with
@@ -211,12 +337,33 @@ class BaseHandler(object):
         dict
             JSON decoded response
         """
-        url = '{tracking_url}/{path}'.format(tracking_url=self.tracking_url, path=path)
-        # Under some security models, the YARN proxy requires that a user click a link in
-        # order to access the tracking URL. Setting a cookie has the same effect, programmatically.
-        cookies = {"checked_{}".format(self.application_id): 'true'}
-        resp = requests.get(url, params, cookies=cookies, timeout=10)
-        return resp.json()
+        # Plain concatenation: cheaper than re-parsing a format template on
+        # every request and the tracking URL is fixed per instance
+        url = self.tracking_url + '/' + path
+        # Revalidate against any previously cached response for this URL so
+        # unchanged payloads come back as a bodyless 304
+        cache_key = (url, tuple(sorted(params.items())))
+        cached = _etag_cache.get(cache_key)
+        headers = None
+        if cached is not None:
+            headers = {}
+            if cached[0] is not None:
+                headers['If-None-Match'] = cached[0]
+            if cached[1] is not None:
+                headers['If-Modified-Since'] = cached[1]
+        resp = self.session.get(url, params=params, cookies=self._cookies,
+                                timeout=10, headers=headers)
+        if resp.status_code == 304 and cached is not None:
+            return cached[2]
+        # Parse the raw bytes directly to skip requests' decode-then-parse step
+        result = orjson.loads(resp.content)
+        etag = resp.headers.get('ETag')
+        last_modified = resp.headers.get('Last-Modified')
+        if etag is not None or last_modified is not None:
+            if len(_etag_cache) >= _ETAG_CACHE_MAX:
+                _etag_cache.clear()
+            _etag_cache[cache_key] = (etag, last_modified, result)
+        return result
 
     def generate_standardized_info(self, yarn_application_info):
         """Transforms information from the YARN ResourceManager and the YARN ApplicationMaster
@@ -233,17 +380,21 @@ class BaseHandler(object):
             Fields to copy verbatim from the YARN information about the app plus an
             empty 'progress' list to be populated by more specific subtypes
         """
-        verbatim_fields = ["id", "name", "user", "applicationType", "queue",
-                           "startedTime", "allocatedMB", "allocatedVCores",
-                           "trackingUrl", "state", "memorySeconds",
-                           "vcoreSeconds"]
-        r = {k: yarn_application_info[k] for k in verbatim_fields}
+        r = dict(zip(VERBATIM_FIELDS, _get_verbatim_fields(yarn_application_info)))
         r["progress"] = []
         return r
 
 
 class SparkHandler(BaseHandler):
     """Aggregates Spark job information for the frontend."""
+    __slots__ = ("_jobs_path",)
+
+    def __init__(self, tracking_url, application_id, session=None):
+        super().__init__(tracking_url, application_id, session)
+        # The jobs path only depends on the application id, so resolve the
+        # template once per handler instead of once per fetch
+        self._jobs_path = "api/v1/applications/{id}/jobs".format(id=application_id)
+
     def get_jobs(self, status=None):
         """Issues an HTTP GET to fetch information about Spark jobs.
 
@@ -257,9 +408,8 @@ class SparkHandler(BaseHandler):
         dict
             JSON-decoded response, https://spark.apache.org/docs/latest/monitoring.html#rest-api
         """
-        path = "api/v1/applications/{id}/jobs".format(id=self.application_id)
         params = {"status": status} if status is not None else {}
-        return self.get_url(path, **params)
+        return self.get_url(self._jobs_path, **params)
 
     def _aggregate_tasks(self, name, tasks):
         """Aggregates the task metrics for a job.
@@ -274,15 +424,17 @@ class SparkHandler(BaseHandler):
         Returns
         -------
         dict
-            Progress object in dictionary form
+            Progress information in dictionary form
         """
-        p = Progress(name)
-        for jobinfo in tasks:
-            p.completed += jobinfo["numCompletedTasks"]
-            p.failed += jobinfo["numFailedTasks"]
-            p.running += jobinfo["numActiveTasks"]
-            p.total += jobinfo["numTasks"]
-        return p.to_dict()
+        # sum(map(itemgetter(...))) keeps the per-job loop in C rather than
+        # paying bytecode dispatch for every field of every job
+        return {
+            "name": name,
+            "completed": sum(map(itemgetter("numCompletedTasks"), tasks)),
+            "failed": sum(map(itemgetter("numFailedTasks"), tasks)),
+            "running": sum(map(itemgetter("numActiveTasks"), tasks)),
+            "total": sum(map(itemgetter("numTasks"), tasks)),
+        }
 
     def generate_standardized_info(self, yarn_application_info):
         """Transforms information from the YARN ResourceManager and the Spark ApplicationMaster
@@ -300,22 +452,23 @@ class SparkHandler(BaseHandler):
             'progress' list of dictionaries about Running and Total tasks
         """
         r = super().generate_standardized_info(yarn_application_info)
-        jobs = self.get_jobs("running")
-        if jobs:
-            r["progress"].append(self._aggregate_tasks("Running Tasks", jobs))
-            r["state"] = "RUNNING"
-        else:
-            r["state"] = "IDLE"
-            r["progress"].append(Progress("Running Tasks").to_dict())
-
+        # One fetch of all jobs; the running subset is derived client-side
+        # rather than spending a second HTTP round-trip on a filtered query
         all_jobs = self.get_jobs()
+        running_jobs = [job for job in all_jobs if job.get("status") == "RUNNING"]
+        # Aggregating an empty running list yields the all-zero progress
+        # entry an idle app should report, so no special case is needed
+        r["progress"].append(self._aggregate_tasks("Running Tasks", running_jobs))
         r["progress"].append(self._aggregate_tasks("Total", all_jobs))
+        r["state"] = "RUNNING" if running_jobs else "IDLE"
 
         return r
 
 
 class MapredHandler(BaseHandler):
     """Aggregates MapReduce job information for the frontend."""
+    __slots__ = ()
+
     def get_jobs(self):
         """Issues an HTTP GET to fetch information about MapReduce jobs.
 
@@ -339,15 +492,15 @@ class MapredHandler(BaseHandler):
         Returns
         -------
         dict
-            Progress object in dictionary form
+            Progress information in dictionary form
         """
-        p = Progress("Maps")
-        for jobinfo in tasks:
-            p.completed += jobinfo["mapsCompleted"]
-            p.failed += jobinfo["failedMapAttempts"]
-            p.running += jobinfo["mapsRunning"]
-            p.total += jobinfo["mapsTotal"]
-        return p.to_dict()
+        return {
+            "name": "Maps",
+            "completed": sum(map(itemgetter("mapsCompleted"), tasks)),
+            "failed": sum(map(itemgetter("failedMapAttempts"), tasks)),
+            "running": sum(map(itemgetter("mapsRunning"), tasks)),
+            "total": sum(map(itemgetter("mapsTotal"), tasks)),
+        }
 
     def _aggregate_reduces(self, tasks):
         """Aggregates the reducer metrics for a job.
@@ -362,15 +515,15 @@ class MapredHandler(BaseHandler):
         Returns
         -------
         dict
-            Progress object in dictionary form
+            Progress information in dictionary form
         """
-        p = Progress("Reduces")
-        for jobinfo in tasks:
-            p.completed += jobinfo["reducesCompleted"]
-            p.failed += jobinfo["failedReduceAttempts"]
-            p.running += jobinfo["reducesRunning"]
-            p.total += jobinfo["reducesTotal"]
-        return p.to_dict()
+        return {
+            "name": "Reduces",
+            "completed": sum(map(itemgetter("reducesCompleted"), tasks)),
+            "failed": sum(map(itemgetter("failedReduceAttempts"), tasks)),
+            "running": sum(map(itemgetter("reducesRunning"), tasks)),
+            "total": sum(map(itemgetter("reducesTotal"), tasks)),
+        }
 
     def generate_standardized_info(self, yarn_application_info):
         """Transforms information from the YARN ResourceManager and the MapReduce ApplicationMaster
@@ -428,6 +581,30 @@ class YARNPoller(object):
         self.redis_key = redis_key
         self.application_handlers = {}
         self.state = {"application-metrics": {}, "cluster-metrics": {}}
+        # Handler instances reused across polls, keyed by application id, so
+        # per-app state such as resolved URL paths survives between cycles
+        self._handler_cache = {}
+        # Maps application id to (next_retry_time, attempts) after a tracking
+        # URL failure, so broken apps back off instead of burning a pool slot
+        # at full speed every poll
+        self._failure_backoff = {}
+        # Digest of the state most recently written to redis, used to skip
+        # rewrites when nothing changed between polls without holding a
+        # second copy of the multi-MB payload
+        self._last_digest = None
+        # Single-slot hand-off to the writer thread below; stale snapshots
+        # are dropped so the poller never waits on serialization or redis
+        self._write_queue = queue.Queue(maxsize=1)
+        self._writer = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer.start()
+        # Set from other threads to cut the inter-poll wait short
+        self._wake = threading.Event()
+
+    def request_refresh(self):
+        """Wakes the polling loop so the next update starts immediately
+        instead of after the remainder of the current interval.
+        """
+        self._wake.set()
 
     def register_handler(self, application_type, handler_class):
         """Registers a BaseHandler class to handle fetching progress details
@@ -442,30 +619,27 @@ class YARNPoller(object):
         """
         self.application_handlers[application_type] = handler_class
 
-    def _make_application_handler(self, yarn_application_info):
-        """Instantiates a handler for the given YARN application info
-        based on its applicationType field value and the registered handlers.
-
-        Falls back on using a BaseHandler instance for basic metrics when there
-        is no handler registered for the type in the response.
+    def _get_handler(self, klass, app):
+        """Gets a handler instance for the app, reusing the one cached from
+        a previous poll when the app and its tracking URL are unchanged.
 
         Parameters
         ----------
-        yarn_application_info: dict
-            Information about a single app retrieved using YARNHandler.cluster_applications()
+        klass: type
+            BaseHandler subclass registered for the app's type
+        app: dict
+            Application information from the YARN ResourceManager
 
         Returns
         -------
-        instance of BaseHandler
-
-        Raises
-        ------
-        KeyError
-            When the response from YARN does not contain the expected app structure
+        instance of klass
         """
-        app_type = yarn_application_info['applicationType']
-        klass = self.application_handlers.get(app_type, BaseHandler)
-        return klass(yarn_application_info['trackingUrl'], yarn_application_info['id'])
+        handler = self._handler_cache.get(app['id'])
+        if (handler is None or type(handler) is not klass
+                or handler.tracking_url != app['trackingUrl'].rstrip('/')):
+            handler = klass(app['trackingUrl'], app['id'])
+            self._handler_cache[app['id']] = handler
+        return handler
 
     def _generate_listing(self):
         """Computes the listing of YARN applications and the additional information
@@ -480,14 +654,20 @@ class YARNPoller(object):
             YARN application IDs as keys mapped to application detail dictionaries
             as values
         """
-        # Fetch all running applications
-        cluster_apps = self.yarn_handler.cluster_applications("RUNNING")
+        # Fetch all running applications. Application types are deliberately
+        # not filtered server-side: apps without a registered handler still
+        # belong in the listing with their base YARN info.
+        params = {'deSelects': YARN_APPS_DESELECTS} if YARN_APPS_DESELECTS else {}
+        cluster_apps = self.yarn_handler.cluster_applications("RUNNING", **params)
         if 'apps' not in cluster_apps or cluster_apps['apps'] is None:
             # Something might be wrong if there are no applications
             logger.warn('No application data available')
             return {}
         apps = cluster_apps['apps']['app']
 
+        # Local alias saves an attribute lookup per task in the fan-out below
+        handlers = self.application_handlers
+
         def run_task(app):
             """Fetches application details using the appropriate registered
             handler for the application type.
@@ -502,78 +682,211 @@ class YARNPoller(object):
             dict
                 Application information in the format expected by the frontend
             """
-            std_info = None
+            # The base info comes straight from the RM response with no
+            # additional I/O, so compute it once up front and upgrade it
+            # with type-specific detail when a handler is registered
+            std_info = BaseHandler(app['trackingUrl'], app['id']).generate_standardized_info(app)
+            klass = handlers.get(app['applicationType'], BaseHandler)
+            if klass is BaseHandler:
+                return std_info
+            backoff = self._failure_backoff.get(app['id'])
+            if backoff is not None and time.monotonic() < backoff[0]:
+                # Still backing off from an earlier failure: skip the fetch
+                # and leave the pool slot for healthy apps
+                std_info["state"] = NON_RESPONSIVE_STATE
+                return std_info
             try:
-                ah = self._make_application_handler(app)
-                std_info = ah.generate_standardized_info(app)
-            except Exception as ex:
+                handler = self._get_handler(klass, app)
+                std_info.update(handler.generate_standardized_info(app))
+                self._failure_backoff.pop(app['id'], None)
+            except Exception:
                 # For now, we log all exceptions as errors, but we should
                 # be more selective about what we catch and handle as a
                 # passing warning versus let bubble because it's a real problem
                 logger.exception("Error for application %s %s", app["id"],
                                  app["name"])
-            # Fall back to just the yarn information
-            if std_info is None:
-                ah = BaseHandler(app['trackingUrl'], app['id'])
-                std_info = ah.generate_standardized_info(app)
+                # Double the back-off per consecutive failure, capped at five
+                # minutes so recovered apps are still picked up reasonably fast
+                attempts = backoff[1] + 1 if backoff is not None else 0
+                self._failure_backoff[app['id']] = (
+                    time.monotonic() + min(300, 15 * 2 ** attempts), attempts)
                 # Indicate that the tracking API for the app did not respond
                 std_info["state"] = NON_RESPONSIVE_STATE
 
             return std_info
 
-        # Wait for all async results, raise if it takes too long
-        async_result = threadpool.map(run_task, apps, timeout=THREADPOOL_TIMEOUT)
-        # Materialize results as a list, we need them all anyway
-        results = list(async_result)
-        # Count the number of apps with the non-responsive state set
-        num_unknown_state = sum(1 if info['state'] == NON_RESPONSIVE_STATE else 0
-                                for info in results)
+        result = {}
+        # Tallied while materializing results below; bools coerce to 0/1 so
+        # no separate counting pass over the listing is needed
+        num_unknown_state = 0
+        if len(apps) < 4:
+            # For a handful of apps the submission and wakeup overhead of
+            # the pool outweighs the parallelism; just run inline
+            for app in apps:
+                info = run_task(app)
+                result[info["id"]] = info
+                num_unknown_state += (info['state'] == NON_RESPONSIVE_STATE)
+        else:
+            # Fan out one task per app and key results by app id directly as
+            # they finish, so a slow tracking URL does not hold up results
+            # from faster ones and no interim list is materialized
+            threadpool = get_threadpool()
+            futures = {threadpool.submit(run_task, app): app for app in apps}
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=THREADPOOL_TIMEOUT):
+                    info = future.result()
+                    result[info["id"]] = info
+                    num_unknown_state += (info['state'] == NON_RESPONSIVE_STATE)
+            except concurrent.futures.TimeoutError:
+                # Cancel the stragglers and degrade just their apps to the
+                # non-responsive state instead of losing the whole cycle
+                for future, app in futures.items():
+                    if app['id'] in result:
+                        continue
+                    future.cancel()
+                    info = BaseHandler(app['trackingUrl'], app['id']).generate_standardized_info(app)
+                    info["state"] = NON_RESPONSIVE_STATE
+                    result[info["id"]] = info
+                    num_unknown_state += 1
+                logger.warn('Timed out waiting for %d of %d application updates',
+                            len(apps) - sum(future.done() for future in futures),
+                            len(apps))
 
         # If all of the applications are non-responsive, then it's quite possible
         # the YARN proxy is down and the true state of everything should be unknown,
         # not unresponsive which suggests an app problem
-        if num_unknown_state == len(results):
-            for result in results:
-                result['state'] = 'UNKNOWN'
-
-        # Key all results by the app id
-        result = {info["id"]: info for info in results}
-        logger.debug("Update {}: Result: {}...".format(self, str(result)[:80]))
+        if num_unknown_state == len(result):
+            for info in result.values():
+                info['state'] = 'UNKNOWN'
+
+        # Drop cached handlers and back-off entries for apps that are no
+        # longer running
+        self._handler_cache = {app_id: handler
+                               for app_id, handler in self._handler_cache.items()
+                               if app_id in result}
+        self._failure_backoff = {app_id: backoff
+                                 for app_id, backoff in self._failure_backoff.items()
+                                 if app_id in result}
+
+        if logger.isEnabledFor(logging.DEBUG):
+            # str(result) renders the whole listing; only pay for it when
+            # debug logging is actually on
+            logger.debug("Update {}: Result: {}...".format(self, str(result)[:80]))
 
         return result
 
+    def _persist(self, state):
+        """Serializes a state snapshot and writes it to redis.
+
+        Parameters
+        ----------
+        state: dict
+            Snapshot of the cluster application state to persist
+        """
+        # JSON bytes go to redis natively without re-encoding
+        payload = dumps_bytes(state)
+        digest = hashlib.blake2b(payload, digest_size=16).digest()
+        # Batch all key updates into one pipeline so the worker pays a single
+        # network round-trip to redis per cycle no matter how many keys grow
+        # out of this write
+        with self.redis_client.pipeline(transaction=False) as pipe:
+            # Only pay for the state write when something actually changed
+            # since the last poll
+            if digest != self._last_digest:
+                pipe.set(self.redis_key, payload)
+                # Prerender the hot API payloads so the web tier can stream
+                # these bytes straight to clients without rebuilding and
+                # re-serializing them per request
+                pipe.set(self.redis_key + ':applications',
+                         dumps_bytes({'data': list(state['application-metrics'].values())}))
+                pipe.set(self.redis_key + ':cluster',
+                         dumps_bytes({'data': [state['cluster-metrics'].get('clusterMetrics', {})]}))
+                # Bump the version stamp so readers can detect an unchanged
+                # blob without fetching or re-parsing it
+                pipe.incr(self.redis_key + ':version')
+                self._last_digest = digest
+            else:
+                logger.debug("Cluster state unchanged, skipping redis write")
+            # Track liveness under a separate key so that consumers can detect a
+            # healthy-but-idle worker without the state blob changing every poll.
+            # Make the datetime conform to true ISO-8601 by adding Z(ulu) to indicate
+            # this is truly a UTC time (without a timezone, the spec says it should be
+            # treated as local time which is definitely NOT what we want)
+            # https://en.wikipedia.org/wiki/ISO_8601#Time_zone_designators
+            pipe.set(self.redis_key + ':refresh-datetime',
+                     datetime.datetime.utcnow().isoformat() + 'Z')
+            pipe.execute()
+
+    def _writer_loop(self):
+        """Persists state snapshots handed off by `run_update` so JSON
+        encoding and redis writes overlap the next poll's HTTP wait instead
+        of extending the cycle.
+        """
+        while True:
+            state = self._write_queue.get()
+            try:
+                self._persist(state)
+            except Exception:
+                logger.exception('Unknown exception while persisting state')
+
     def run_update(self):
-        """Fetches YARN cluster and application information, and store it timestamped
-        in redis as a JSON string for retrieval by the frontend.
+        """Fetches YARN cluster and application information, and hands it to
+        the writer thread to store timestamped in redis as a JSON string for
+        retrieval by the frontend.
         """
         logger.info("Updating metrics from YARN")
+        # Kick off the metrics fetch on the pool so its round-trip overlaps
+        # with the per-application fan-out instead of following it
+        metrics_future = get_threadpool().submit(self.yarn_handler.cluster_metrics)
         self.state["application-metrics"] = self._generate_listing()
-        self.state["cluster-metrics"] = self.yarn_handler.cluster_metrics()
+        self.state["cluster-metrics"] = metrics_future.result(timeout=10)
         # Include the last queried cluster RM for UI purposes
         self.state['current-rm'] = self.yarn_handler.current_rm()
-        # Make the datetime conform to true ISO-8601 by adding Z(ulu) to indicate
-        # this is truly a UTC time (without a timezone, the spec says it should be
-        # treated as local time which is definitely NOT what we want)
-        # https://en.wikipedia.org/wiki/ISO_8601#Time_zone_designators
-        self.state["refresh-datetime"] = datetime.datetime.utcnow().isoformat() + 'Z'
-        self.redis_client.set(self.redis_key, json.dumps(self.state))
+        # Hand a shallow snapshot to the writer thread (values are replaced,
+        # never mutated, between polls), displacing any stale snapshot it
+        # has not picked up yet
+        snapshot = dict(self.state)
+        try:
+            self._write_queue.put_nowait(snapshot)
+        except queue.Full:
+            try:
+                self._write_queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._write_queue.put_nowait(snapshot)
         logger.info("Done updating metrics from YARN")
 
     def loop(self, sleep_time):
         """Executes the `run_update` message in a loop that catches and logs
         all exceptions indefinitely.
 
+        Runs on a fixed cadence from a monotonic clock: each update is
+        scheduled one interval after the previous deadline rather than after
+        the previous update finished, so the poll period does not drift as
+        updates slow down under load.
+
         Parameters
         ----------
         sleep_time: float
-            Time to sleep after executing `run_update`
+            Interval between the starts of successive `run_update` calls
         """
+        deadline = time.monotonic()
         while True:
+            deadline += sleep_time
             try:
                 self.run_update()
             except Exception:
                 logger.exception('Unknown exception while updating')
-            time.sleep(sleep_time)
+            now = time.monotonic()
+            if deadline < now - sleep_time:
+                # The update overran by more than a full period; rebase the
+                # schedule instead of firing a burst of catch-up polls
+                deadline = now + sleep_time
+            # Interruptible sleep: request_refresh sets the event to start
+            # the next update without waiting out the interval
+            if self._wake.wait(max(0, deadline - now)):
+                self._wake.clear()
+                deadline = time.monotonic()
 
 
 def main():
@@ -591,15 +904,19 @@ def main():
     logger.info('Redis endpoint: %s', redis_endpoint)
     logger.info('YARN endpoint(s): %s', yarn_endpoint)
 
+    poll_sleep = int(os.environ["YARN_POLL_SLEEP"])
+
     host, port = redis_endpoint.split(":")
     redis_client = redis.StrictRedis(host=host, port=port)
-    yarn_handler = YARNHandler(yarn_endpoint)
+    # Cache RM responses for half the poll interval so redundant queries
+    # within a cycle (or overeager polling) collapse into one RM hit
+    yarn_handler = YARNHandler(yarn_endpoint, cache_ttl=poll_sleep / 2)
 
     ym = YARNPoller(redis_client, yarn_handler, redis_key)
     ym.register_handler("SPARK", SparkHandler)
     ym.register_handler("MAPREDUCE", MapredHandler)
     ym.register_handler("MAPRED", MapredHandler)
-    ym.loop(int(os.environ["YARN_POLL_SLEEP"]))
+    ym.loop(poll_sleep)
 
 
 if __name__ == '__main__':
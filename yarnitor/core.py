@@ -1,12 +1,25 @@
 from flask import Flask
 from flask_redis import FlaskRedis
 from flask_caching import Cache
-from .ui import ui_bp
-from .api import api_bp
 import os
 
+try:
+    from flask_orjson import OrjsonProvider
+except ImportError:
+    # flask-orjson requires the flask>=2.2 JSON provider API; older flask
+    # falls back to the stock (slower) jsonify path configured below.
+    OrjsonProvider = None
+
 app = Flask(__name__)
 
+# Serialize API responses with orjson when the provider API is available
+if OrjsonProvider is not None and hasattr(app, 'json'):
+    app.json = OrjsonProvider(app)
+# Skip pretty-printing and key sorting: both cost CPU on large
+# application listings and neither matters to the UI
+app.config['JSONIFY_PRETTYPRINT_REGULAR'] = False
+app.config['JSON_SORT_KEYS'] = False
+
 # Whether we're testing flask or not
 app.config['FLASK_TESTING'] = os.getenv('FLASK_TESTING')
 # Which redis to talk to
@@ -21,6 +34,11 @@ app.config['DEFAULT_CLUSTER_KEY'] = os.getenv('DEFAULT_CLUSTER_KEY', 'default')
 redis_store = FlaskRedis(app)
 cache = Cache(app, config={"CACHE_TYPE": "simple"})
 
+# Blueprints are imported after the extensions above exist so that they can
+# import cache/redis_store from this module at their own import time
+from .ui import ui_bp
+from .api import api_bp
+
 # Register blueprints for APIs
 app.register_blueprint(api_bp)
 app.register_blueprint(ui_bp)
@@ -1,23 +1,30 @@
 """YARN monitoring model."""
-import json
+import functools
+
+from flask import g
 
 from .core import cache, redis_store
 
-# YARN model singletons by redis/cluster key
-_instances = {}
+try:
+    import orjson
+except ImportError:
+    # The stdlib codec exposes the same loads subset used here, just slower
+    import json as orjson
 
 
+@functools.lru_cache(maxsize=None)
 def get_model(key):
     """Gets a singleton YARNModel instance for the given key.
 
+    lru_cache's internal lock makes this safe under threaded WSGI servers
+    without a hand-rolled dict-plus-lock, and hits stay on the C fast path.
+
     Parameters
     ----------
     key: str
         Redis key / cluster name under which to store app info
     """
-    if key not in _instances:
-        _instances[key] = YARNModel(key)
-    return _instances[key]
+    return YARNModel(key)
 
 
 class YARNModel(object):
@@ -26,12 +33,44 @@ class YARNModel(object):
     """
     def __init__(self, key):
         self.key = key
+        # Last parsed state blob and the worker version stamp it came from,
+        # reused while the stamp is unchanged to skip re-parsing
+        self._parsed = {}
+        self._parsed_version = None
 
     @property
-    @cache.cached(timeout=5)
     def state(self):
-        state = redis_store.get(self.key)
-        return json.loads(state) if state is not None else {}
+        """Gets the last known cluster state, memoized for the duration of
+        the current request so endpoints touching it several times pay for
+        at most one cache lookup and parse.
+        """
+        attr = '_yarn_state_' + self.key
+        state = getattr(g, attr, None)
+        if state is None:
+            state = self._fetch_state()
+            setattr(g, attr, state)
+        return state
+
+    @cache.cached(timeout=5)
+    def _fetch_state(self):
+        """Fetches and parses the state blob stored in redis by the worker,
+        cached for a few seconds across requests.
+
+        The worker bumps a version stamp alongside each changed write, so
+        both keys are fetched in one round-trip and the previously parsed
+        state is reused whenever the stamp has not moved.
+        """
+        with redis_store.pipeline(transaction=False) as pipe:
+            pipe.get(self.key + ':version')
+            pipe.get(self.key)
+            version, state = pipe.execute()
+        if state is None:
+            return {}
+        if version is not None and version == self._parsed_version:
+            return self._parsed
+        self._parsed = orjson.loads(state)
+        self._parsed_version = version
+        return self._parsed
 
     def exists(self):
         """Gets if information about the cluster exists.
@@ -50,6 +89,10 @@ class YARNModel(object):
         str
             ISO-8601 datetime string
         """
+        refresh = redis_store.get(self.key + ':refresh-datetime')
+        if refresh is not None:
+            return refresh.decode('utf-8')
+        # Fall back to the field embedded in the state blob by older workers
         return self.state.get("refresh-datetime", '')
 
     def current_rm(self):
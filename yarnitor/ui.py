@@ -1,21 +1,63 @@
 """YARN monitoring built-in UI."""
+import functools
+import hashlib
+import os
 import time
 
-from flask import Blueprint, abort, current_app, render_template, url_for
+from flask import Blueprint, Response, request, url_for
+
+from .core import cache
+from .model import get_model
 
 ui_bp = Blueprint('ui', __name__, static_folder='static')
-version = str(time.time())
 
 
-def get_model(cluster):
-    """Gets a YARNModel for a given cluster
+def _static_version():
+    """Computes a version token for cache busting from the content of the
+    static assets, so the token (and thus every versioned asset URL) only
+    changes when the assets themselves do rather than on every restart.
 
     Returns
     -------
-    YARNModel
+    str
+        Short hex digest, or a timestamp if the static dir is unreadable
     """
-    from .model import get_model
-    return get_model(cluster)
+    # 6 bytes keeps the ?v= token short in the dozens of asset URLs per
+    # page while leaving collisions across deploys vanishingly unlikely
+    digest = hashlib.blake2b(digest_size=6)
+    static_dir = os.path.join(os.path.dirname(__file__), 'static')
+    try:
+        for dirpath, dirnames, filenames in sorted(os.walk(static_dir)):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                with open(os.path.join(dirpath, filename), 'rb') as f:
+                    digest.update(f.read())
+    except OSError:
+        return str(time.time())
+    return digest.hexdigest()
+
+
+version = _static_version()
+
+
+@functools.lru_cache(maxsize=256)
+def _versioned(endpoint, items):
+    """Builds a versioned URL for hashable endpoint arguments, memoized
+    since both the URL map and the version token are fixed per process.
+
+    Parameters
+    ----------
+    endpoint: str
+        Flask endpoint name
+    items: tuple
+        Sorted (name, value) pairs of url_for arguments
+
+    Returns
+    -------
+    str
+        Result of Flask.url_for
+    """
+    return url_for(endpoint, v=version, **dict(items))
 
 
 def versioned_url_for(endpoint, **args):
@@ -30,26 +72,121 @@ def versioned_url_for(endpoint, **args):
     str
         Result of Flask.url_for
     """
-    args['v'] = version
-    return url_for(endpoint, **args)
+    return _versioned(endpoint, tuple(sorted(args.items())))
+
+
+def static_url(filename):
+    """Builds a versioned URL for a static asset by string concatenation.
+
+    Static URLs have a fixed `{prefix}/{filename}?v={version}` shape, so
+    the asset-heavy index template can skip Werkzeug's URL builder for
+    each reference.
+
+    Parameters
+    ----------
+    filename: str
+        Path of the asset below the blueprint static folder
+
+    Returns
+    -------
+    str
+    """
+    return '{}/{}?v={}'.format(ui_bp.static_prefix, filename, version)
+
+
+def _cache_static_forever(response):
+    """Marks static responses as immutable and cacheable for a year.
+
+    Safe because every static reference carries a content-derived ?v=
+    token, so changed assets get new URLs and never need revalidation.
+    """
+    # The app-level static rule shadows the blueprint's identical one, so
+    # match both endpoints
+    if request.endpoint in ('static', 'ui.static'):
+        response.headers['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+# Body for unknown-cluster responses; a fresh Response is built per request
+# since Response objects are mutable
+_NOT_FOUND_BODY = b'Cluster not found'
 
 
-@ui_bp.context_processor
-def override_url_for():
-    """Overrides `url_for` in templates to append a version
-    to the query string for cache busting purposes on each
-    restart of the server.
+# Maps cluster name to (exists, expiry) so bursts of page loads collapse
+# into one redis probe per cluster per TTL window
+_exists_cache = {}
+_EXISTS_TTL = 5
+# Upper bound on cached answers; the cache is simply cleared when it fills
+# (cluster names come from request paths, so scanners could otherwise grow
+# it without limit) since entries are cheap to repopulate
+_EXISTS_CACHE_MAX = 1024
+
+
+def _cluster_exists(cluster):
+    """Gets whether data for the cluster exists, reusing a recent answer
+    for a few seconds.
+
+    Parameters
+    ----------
+    cluster: str
+        Cluster name
 
     Returns
     -------
-    dict
-        With versioned_url_for function assigned to key url_for
+    bool
     """
-    return dict(url_for=versioned_url_for)
+    now = time.monotonic()
+    hit = _exists_cache.get(cluster)
+    if hit is not None and hit[1] > now:
+        return hit[0]
+    exists = get_model(cluster).exists()
+    if len(_exists_cache) >= _EXISTS_CACHE_MAX:
+        _exists_cache.clear()
+    _exists_cache[cluster] = (exists, now + _EXISTS_TTL)
+    return exists
+
+
+@ui_bp.record_once
+def _load_index_template(state):
+    """Resolves the index.html template object and the default cluster
+    name once at registration so renders skip the per-request loader walk,
+    auto-reload stat calls, and proxied config lookups.
+    """
+    ui_bp.index_template = state.app.jinja_env.get_template('index.html')
+    ui_bp.default_cluster = state.app.config['DEFAULT_CLUSTER_KEY']
+    ui_bp.static_prefix = (state.url_prefix or '') + ui_bp.static_url_path
+    # Registered on the app rather than the blueprint: static requests hit
+    # the app-level static endpoint, for which blueprint hooks never run
+    state.app.after_request(_cache_static_forever)
+    # Bind the template helpers into the environment once instead of
+    # passing them per render; url_for is deliberately shadowed app-wide
+    # so every template gets versioned URLs
+    state.app.jinja_env.globals['url_for'] = versioned_url_for
+    state.app.jinja_env.globals['static_url'] = static_url
+    # Warm the render cache for the clusters known at boot so even first
+    # hits skip Jinja; unknown clusters still render on demand
+    clusters = state.app.config.get('CLUSTERS', [ui_bp.default_cluster])
+    with state.app.test_request_context():
+        for cluster in clusters:
+            _render_index(cluster)
+
+
+@cache.memoize(timeout=300)
+def _render_index(cluster):
+    """Renders index.html for a cluster, memoized per cluster since the
+    output only varies with the cluster name and the process-lifetime
+    version string.
+
+    Returns
+    -------
+    str
+        Rendered HTML
+    """
+    # The url_for override and static_url come from the Jinja globals
+    # bound at registration, so only the cluster varies per render
+    return ui_bp.index_template.render(cluster=cluster)
 
 
-@ui_bp.route('/', defaults={'cluster': None})
-@ui_bp.route('/<cluster>')
 def index(cluster):
     """Renders the YARNitor single-page app.
 
@@ -59,8 +196,24 @@ def index(cluster):
         Cluster name or blank to use the default
     """
     if cluster is None:
-        cluster = current_app.config['DEFAULT_CLUSTER_KEY']
-    if get_model(cluster).exists():
-        return render_template('index.html', cluster=cluster)
+        cluster = ui_bp.default_cluster
+    # The existence check stays outside the memoized render so missing
+    # clusters keep 404ing and never pin a rendered page in the cache
+    if _cluster_exists(cluster):
+        # The shell only changes with the asset version, so a strong ETag
+        # lets returning browsers revalidate with a 304 instead of pulling
+        # the full body again
+        resp = Response(_render_index(cluster), mimetype='text/html')
+        resp.set_etag('{}-{}'.format(version, cluster))
+        resp.cache_control.max_age = 0
+        resp.cache_control.must_revalidate = True
+        return resp.make_conditional(request)
     else:
-        abort(404)
+        # Skip abort()'s raise/catch and error-handler dispatch; the body
+        # does not need to be dynamic for an internal monitor
+        return Response(_NOT_FOUND_BODY, status=404, mimetype='text/plain')
+
+
+# Registered explicitly so both URL shapes share one endpoint and view
+ui_bp.add_url_rule('/', 'index', index, defaults={'cluster': None})
+ui_bp.add_url_rule('/<cluster>', 'index', index)